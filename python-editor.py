@@ -1,14 +1,37 @@
 # app.py - Edit2 Python Flask Server
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from flask import Flask, request, jsonify, send_from_directory
 from flask_cors import CORS
 import os
+import re
 import json
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
+from xml.parsers import expat
+import stat
 import subprocess
-from datetime import datetime
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+try:
+    from whitenoise import WhiteNoise
+except ImportError:
+    WhiteNoise = None
 
 app = Flask(__name__)
 CORS(app)
@@ -17,8 +40,13 @@ CORS(app)
 DATA_DIR = Path('./data')
 DATA_DIR.mkdir(exist_ok=True)
 
+# Long-lived libgit2 handle (falls back to the git CLI when unavailable)
+REPO = None
+GIT_LOCK = threading.Lock()
+
 def init_git():
     """Initialize Git repository if not exists"""
+    global REPO
     try:
         subprocess.run(['git', 'rev-parse', '--git-dir'], 
                       cwd=DATA_DIR, capture_output=True, check=True)
@@ -26,181 +54,558 @@ def init_git():
         subprocess.run(['git', 'init'], cwd=DATA_DIR)
         subprocess.run(['git', 'config', 'user.email', 'edit2@local'], cwd=DATA_DIR)
         subprocess.run(['git', 'config', 'user.name', 'Edit2 User'], cwd=DATA_DIR)
+    
+    # Temp files left over by a crash in the middle of write_file(); fresh ones
+    # may still belong to a worker that is draining during a graceful reload
+    cutoff = time.time() - 3600
+    for tmp in DATA_DIR.glob('.*.tmp'):
+        try:
+            if tmp.stat().st_mtime < cutoff:
+                tmp.unlink()
+        except FileNotFoundError:
+            pass
+    
+    if pygit2 is not None:
+        try:
+            REPO = pygit2.Repository(str(DATA_DIR / '.git'))
+        except pygit2.GitError:
+            REPO = None
+
+def _blob_id(tree, filename):
+    """Return the id of a file in a tree, or None if it is not there"""
+    return tree[filename].id if filename in tree else None
+
+def git_commit(filename, message):
+    """Stage and commit a file; return the short HEAD hash"""
+    with GIT_LOCK:
+        if REPO is None:
+            script = 'git add -- "$1" && git commit -q -m "$2"; git rev-parse HEAD'
+            result = subprocess.run(['sh', '-c', script, 'sh', filename, message],
+                                    cwd=DATA_DIR, capture_output=True, text=True)
+            lines = result.stdout.strip().splitlines()
+            return lines[-1][:7] if lines else ''
+        
+        index = REPO.index
+        index.read()
+        index.add(filename)
+        index.write()
+        tree = index.write_tree()
+        
+        parents = []
+        if not REPO.head_is_unborn:
+            head = REPO.head.peel(pygit2.Commit)
+            if head.tree_id == tree:
+                return str(head.id)[:7]  # Nothing to commit
+            parents = [head.id]
+        
+        signature = REPO.default_signature
+        oid = REPO.create_commit('HEAD', signature, signature, message, tree, parents)
+        return str(oid)[:7]
+
+def git_log(filename, limit=20):
+    """Return the latest commits touching a file, newest first"""
+    with GIT_LOCK:
+        if REPO is None:
+            # Unit-separated fields, NUL-terminated records: safe for any subject
+            cmd = [
+                'git', 'log', '-z',
+                '--pretty=format:%h%x1f%ai%x1f%s',
+                '-n', str(limit), '--', filename
+            ]
+            result = subprocess.run(cmd, cwd=DATA_DIR, capture_output=True, text=True)
+            
+            history = []
+            for record in result.stdout.split('\x00'):
+                if record:
+                    hash, timestamp, message = record.split('\x1f', 2)
+                    history.append({"hash": hash, "timestamp": timestamp, "message": message})
+            return history
+        
+        history = []
+        if REPO.head_is_unborn:
+            return history
+        
+        for commit in REPO.walk(REPO.head.target):
+            blob_id = _blob_id(commit.tree, filename)
+            parent_id = _blob_id(commit.parents[0].tree, filename) if commit.parents else None
+            if blob_id == parent_id:
+                continue
+            
+            author = commit.author
+            tz = timezone(timedelta(minutes=author.offset))
+            history.append({
+                "hash": str(commit.id)[:7],
+                "timestamp": datetime.fromtimestamp(author.time, tz).strftime('%Y-%m-%d %H:%M:%S %z'),
+                "message": commit.message.split('\n', 1)[0]
+            })
+            if len(history) >= limit:
+                break
+        return history
+
+# Persistent 'git cat-file --batch' for the CLI fallback, guarded by GIT_LOCK
+_CAT_FILE = None
+
+def _cat_file(spec):
+    """Read an object through the long-lived cat-file process"""
+    global _CAT_FILE
+    if '\n' in spec:
+        raise ValueError(f'Invalid object name: {spec!r}')
+    
+    for _ in range(2):
+        if _CAT_FILE is None or _CAT_FILE.poll() is not None:
+            _CAT_FILE = subprocess.Popen(['git', 'cat-file', '--batch'], cwd=DATA_DIR,
+                                         stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        try:
+            _CAT_FILE.stdin.write(spec.encode('utf-8') + b'\n')
+            _CAT_FILE.stdin.flush()
+            header = _CAT_FILE.stdout.readline()
+        except BrokenPipeError:
+            header = b''
+        if header:
+            break
+        _CAT_FILE = None  # Process died; restart it once
+    
+    # "<oid> <type> <size>" on success, "<spec> missing" otherwise
+    parts = header.split()
+    if len(parts) != 3 or not parts[2].isdigit():
+        raise KeyError(header.decode('utf-8', 'replace').strip() or spec)
+    data = _CAT_FILE.stdout.read(int(parts[2]))
+    _CAT_FILE.stdout.read(1)  # Trailing newline
+    return data
+
+def git_head():
+    """Return the commit id HEAD points at, or None before the first commit"""
+    if REPO is not None:
+        with GIT_LOCK:
+            return None if REPO.head_is_unborn else str(REPO.head.target)
+    
+    # Resolve the ref by hand: a file read or two instead of a git process
+    git_dir = DATA_DIR / '.git'
+    try:
+        head = (git_dir / 'HEAD').read_text().strip()
+        if not head.startswith('ref: '):
+            return head  # Detached HEAD
+        ref = head[5:]
+        try:
+            return (git_dir / ref).read_text().strip()
+        except FileNotFoundError:
+            for line in (git_dir / 'packed-refs').read_text().splitlines():
+                if line.endswith(' ' + ref):
+                    return line.split(' ', 1)[0]
+    except FileNotFoundError:
+        pass
+    return None
+
+def git_show(rev, filename):
+    """Return the content of a file at a given revision"""
+    with GIT_LOCK:
+        if REPO is None:
+            return _cat_file(f'{rev}:{filename}').decode('utf-8')
+        
+        blob = REPO.revparse_single(f'{rev}:{filename}').peel(pygit2.Blob)
+        return blob.data.decode('utf-8')
+
+# Run at import time so WSGI servers (gunicorn) get the repository too
+init_git()
+
+def _indent_xml(elem, space="  ", level=0):
+    """Indent an element tree in place (ET.indent fallback for Python < 3.9)"""
+    pad = "\n" + level * space
+    if len(elem):
+        if not elem.text or not elem.text.strip():
+            elem.text = pad + space
+        for child in elem:
+            _indent_xml(child, space, level + 1)
+        if not child.tail or not child.tail.strip():
+            child.tail = pad
+    if level and (not elem.tail or not elem.tail.strip()):
+        elem.tail = pad
+
+indent_xml = getattr(ET, 'indent', _indent_xml)
 
 def prettify_xml(elem):
     """Return a pretty-printed XML string"""
-    rough_string = ET.tostring(elem, 'unicode')
-    reparsed = minidom.parseString(rough_string)
-    return reparsed.toprettyxml(indent="  ")
+    indent_xml(elem, space="  ")
+    return ET.tostring(elem, encoding='unicode', xml_declaration=True) + "\n"
+
+json_loads = orjson.loads if orjson is not None else json.loads
+
+# Characters a JSON document can start and end with
+_JSON_FIRST = frozenset('{["-0123456789tfn')
+_JSON_LAST = frozenset('}]"0123456789el')
+
+def looks_like_json(content):
+    """Cheap structural check that rejects obviously invalid JSON"""
+    stripped = content.strip(' \t\r\n')
+    return stripped[:1] in _JSON_FIRST and stripped[-1:] in _JSON_LAST
+
+def looks_like_xml(content):
+    """Cheap structural check that rejects obviously invalid XML"""
+    # Only XML whitespace may surround the document, and a BOM only before it
+    stripped = content.lstrip('\ufeff').strip(' \t\r\n')
+    return stripped[:1] == '<' and stripped[-1:] == '>'
+
+def validate_json(content):
+    """Return an error message if content is not valid JSON"""
+    if not looks_like_json(content):
+        return "Invalid JSON format"
+    try:
+        json_loads(content)
+    except json.JSONDecodeError:  # Also raised by orjson
+        return "Invalid JSON format"
+
+def validate_yaml(content):
+    """Return an error message if content is not valid YAML"""
+    try:
+        yaml.load(content, Loader=SafeLoader)
+    except yaml.YAMLError:
+        return "Invalid YAML format"
+
+def _undefined_entity(name, is_parameter_entity):
+    """Refuse entities expat skipped because their declaration is unknown"""
+    raise expat.ExpatError(f'undefined entity &{name};')
+
+# expat never loads external entities or DTDs, so this is XXE-safe as is;
+# it also matches lxml's speed here, so lxml is not worth the dependency
+def validate_xml(content):
+    """Return an error message if content is not well-formed XML (no tree is built)"""
+    if not looks_like_xml(content):
+        return "Invalid XML format"
+    
+    # Same checks as ET.fromstring: namespace prefixes and entities must resolve
+    parser = expat.ParserCreate(namespace_separator='}')
+    parser.SetParamEntityParsing(expat.XML_PARAM_ENTITY_PARSING_NEVER)
+    parser.SkippedEntityHandler = _undefined_entity
+    parser.ExternalEntityRefHandler = lambda *args: 0  # 0 = refuse the reference
+    try:
+        parser.Parse(content, True)
+    except expat.ExpatError:
+        return "Invalid XML format"
+
+# Default file contents, serialised once with a placeholder for the timestamp
+_TS = '{{TS}}'
+_DEFAULT_DATA = {"name": "New File", "created": _TS}
+_DEFAULT_XML = ET.Element("root")
+ET.SubElement(_DEFAULT_XML, "n").text = "New File"
+ET.SubElement(_DEFAULT_XML, "created").text = _TS
+_JSON_TEMPLATE = json.dumps(_DEFAULT_DATA, indent=2)
+_YAML_TEMPLATE = yaml.dump(_DEFAULT_DATA, Dumper=SafeDumper)
+_XML_TEMPLATE = prettify_xml(_DEFAULT_XML)
+
+# Supported extensions: (validator, default content, raw mimetype)
+_HANDLERS = {
+    '.json': (validate_json, _JSON_TEMPLATE, 'application/json'),
+    '.yaml': (validate_yaml, _YAML_TEMPLATE, 'application/yaml'),
+    '.yml': (validate_yaml, _YAML_TEMPLATE, 'application/yaml'),
+    '.xml': (validate_xml, _XML_TEMPLATE, 'application/xml'),
+}
+
+# Allowed file names: no path separators, traversal or leading dot, supported extension only
+_SAFE_NAME = re.compile(r'[A-Za-z0-9_-][A-Za-z0-9._-]{0,127}(\.(?:json|ya?ml|xml))')
+
+# Accept header asking get_file for the bare file instead of a JSON wrapper
+RAW_MIMETYPE = 'application/vnd.edit2.raw'
+
+def ojsonify(data, status=200):
+    """Build a JSON response, serialised with orjson when it is installed"""
+    if orjson is None:
+        response = jsonify(data)
+        response.status_code = status
+        return response
+    return app.response_class(orjson.dumps(data), status=status, mimetype='application/json')
+
+class _GroupSync:
+    """Share one directory fsync between concurrent writers (group commit)"""
+    
+    def __init__(self, path):
+        self.path = path
+        self.cond = threading.Condition()
+        self.requested = 0  # Writers that have asked for a flush
+        self.flushed = 0    # Writers covered by a completed flush
+        self.flushing = False
+    
+    def sync(self):
+        with self.cond:
+            self.requested += 1
+            ticket = self.requested
+            while self.flushed < ticket:
+                if self.flushing:
+                    self.cond.wait()
+                    continue
+                
+                # Become the leader: one fsync covers everyone queued so far
+                self.flushing = True
+                batch = self.requested
+                self.cond.release()
+                try:
+                    fd = os.open(self.path, os.O_RDONLY)
+                    try:
+                        os.fsync(fd)
+                    finally:
+                        os.close(fd)
+                finally:
+                    self.cond.acquire()
+                    self.flushing = False
+                    self.cond.notify_all()
+                self.flushed = batch  # Only reached if the fsync succeeded
+
+_DIR_SYNC = _GroupSync(DATA_DIR)
+
+# Read once at import (os.umask can only be queried by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def write_file(filepath, content):
+    """Atomically replace a file and make the change durable"""
+    fd, tmp = tempfile.mkstemp(dir=filepath.parent, prefix=f'.{filepath.name}.', suffix='.tmp')
+    tmp = Path(tmp)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            # Keep the mode of the file being replaced; new files get 0666 minus umask
+            try:
+                mode = stat.S_IMODE(filepath.stat().st_mode)
+            except FileNotFoundError:
+                mode = 0o666 & ~_UMASK
+            os.fchmod(f.fileno(), mode)
+            f.write(content.encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, filepath)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    _DIR_SYNC.sync()
+
+# Coarse-timestamp filesystems can give two changes the same mtime (up to 2 s apart)
+_RACY_WINDOW_NS = 2 * 10**9
+
+def is_racy(mtime_ns):
+    """Like git's "racy" index entries: a change this recent may be followed by
+    another with the same mtime, so stat fields can't vouch for the content yet"""
+    return time.time_ns() - mtime_ns < _RACY_WINDOW_NS
+
+class _ReadCache:
+    """Latest content of recently read files, bounded by total size"""
+    
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # path -> (stat key, content), least recent first
+        self.size = 0
+        self.lock = threading.Lock()
+    
+    def read(self, filepath, st):
+        if is_racy(st.st_mtime_ns):
+            return filepath.read_text(encoding='utf-8')
+        
+        path = str(filepath)
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry is not None and entry[0] == key:
+                self.entries.move_to_end(path)
+                return entry[1]
+        
+        content = filepath.read_text(encoding='utf-8')
+        # One entry per path, so older versions never linger; big files aren't kept
+        # at all rather than pushing everything else out
+        if st.st_size <= self.max_bytes // 8:
+            with self.lock:
+                old = self.entries.pop(path, None)
+                if old is not None:
+                    self.size -= old[0][2]
+                self.entries[path] = (key, content)
+                self.size += st.st_size
+                while self.size > self.max_bytes:
+                    _, (old_key, _) = self.entries.popitem(last=False)
+                    self.size -= old_key[2]
+        return content
+
+_READ_CACHE = _ReadCache(32 * 2**20)
+
+def read_file(filepath, st):
+    """Read file content, skipping the read when its stat result is unchanged"""
+    return _READ_CACHE.read(filepath, st)
+
+def not_modified(etag):
+    """Build an empty 304 response carrying the current ETag"""
+    response = app.response_class(status=304)
+    response.set_etag(etag, weak=True)
+    return response
+
+def _scan_files():
+    """List editable files in DATA_DIR"""
+    files = []
+    # Same rule as the routes, so every listed name can be opened.
+    # DirEntry.is_file() answers from the readdir data, without another stat()
+    with os.scandir(DATA_DIR) as entries:
+        for entry in entries:
+            if _SAFE_NAME.fullmatch(entry.name) and entry.is_file():
+                files.append(entry.name)
+    return tuple(sorted(files))
+
+@lru_cache(maxsize=1)
+def _list_cached(dir_mtime_ns):
+    """Scan DATA_DIR; keyed on its mtime, which changes on create/delete/rename"""
+    return _scan_files()
+
+def list_data_files():
+    """List editable files, rescanning only when the directory has changed"""
+    dir_mtime_ns = DATA_DIR.stat().st_mtime_ns
+    # A scan taken this close to the last change could miss a second one, so don't cache it
+    if is_racy(dir_mtime_ns):
+        return _scan_files()
+    return _list_cached(dir_mtime_ns)
 
 @app.route('/')
 def index():
-    return render_template('index.html')
+    return app.response_class(_INDEX_BYTES, mimetype='text/html',
+                              headers={'Cache-Control': 'public, max-age=3600'})
 
 @app.route('/api/file/<filename>', methods=['GET'])
 def get_file(filename):
     """Get file content"""
+    match = _SAFE_NAME.fullmatch(filename)
+    if not match:
+        return ojsonify({"error": "Invalid filename"}, 400)
+    _, template, mimetype = _HANDLERS[match.group(1)]
     filepath = DATA_DIR / filename
     
     try:
         # Create default file if not exists
         if not filepath.exists():
-            ext = filepath.suffix
-            default_content = ""
-            
-            if ext == '.json':
-                default_content = json.dumps({
-                    "name": "New File",
-                    "created": datetime.now().isoformat()
-                }, indent=2)
-            elif ext in ['.yaml', '.yml']:
-                default_content = yaml.dump({
-                    "name": "New File",
-                    "created": datetime.now().isoformat()
-                })
-            elif ext == '.xml':
-                root = ET.Element("root")
-                ET.SubElement(root, "n").text = "New File"
-                ET.SubElement(root, "created").text = datetime.now().isoformat()
-                default_content = prettify_xml(root)
-            
-            filepath.write_text(default_content)
-            subprocess.run(['git', 'add', filename], cwd=DATA_DIR)
-            subprocess.run(['git', 'commit', '-m', f'Initial: {filename}'], cwd=DATA_DIR)
+            default_content = template.replace(_TS, datetime.now().isoformat())
+            write_file(filepath, default_content)
+            git_commit(filename, f'Initial: {filename}')
+        
+        # The stat fields identify this version of the file, edits from outside included,
+        # except inside the racy window, where no validator is sent at all
+        st = filepath.stat()
+        racy = is_racy(st.st_mtime_ns)
         
-        content = filepath.read_text()
-        return jsonify({"content": content, "filename": filename})
+        # Raw clients get the file itself (sendfile, conditional GET)
+        if request.accept_mimetypes.best == RAW_MIMETYPE:
+            response = send_from_directory(DATA_DIR.resolve(), filename, mimetype=mimetype,
+                                           conditional=not racy, etag=not racy)
+            if racy:
+                response.headers.pop('Last-Modified', None)
+        else:
+            etag = f'{st.st_ino:x}-{st.st_mtime_ns:x}-{st.st_size:x}'
+            if not racy and request.if_none_match.contains_weak(etag):
+                response = not_modified(etag)
+            else:
+                content = read_file(filepath, st)
+                response = ojsonify({"content": content, "filename": filename})
+                if not racy:
+                    response.set_etag(etag, weak=True)
+        
+        # Both representations share this URL, so caches must key on Accept
+        response.vary.add('Accept')
+        return response
     
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return ojsonify({"error": str(e)}, 500)
 
 @app.route('/api/file/<filename>', methods=['POST'])
 def save_file(filename):
     """Save file content"""
+    match = _SAFE_NAME.fullmatch(filename)
+    if not match:
+        return ojsonify({"error": "Invalid filename"}, 400)
+    validate = _HANDLERS[match.group(1)][0]
+    filepath = DATA_DIR / filename
+    
     try:
         data = request.json
         content = data.get('content', '')
-        filepath = DATA_DIR / filename
         
         # Validate content based on file type
-        ext = filepath.suffix
-        if ext == '.json':
-            json.loads(content)  # Validate JSON
-        elif ext in ['.yaml', '.yml']:
-            yaml.safe_load(content)  # Validate YAML
-        elif ext == '.xml':
-            ET.fromstring(content)  # Validate XML
+        error = validate(content)
+        if error:
+            return ojsonify({"error": error}, 400)
         
         # Save file
-        filepath.write_text(content)
+        write_file(filepath, content)
         
         # Git commit
         timestamp = datetime.now().isoformat()
-        subprocess.run(['git', 'add', filename], cwd=DATA_DIR)
-        subprocess.run(['git', 'commit', '-m', f'Update {filename}: {timestamp}'], cwd=DATA_DIR)
-        
-        # Get commit hash
-        result = subprocess.run(['git', 'rev-parse', 'HEAD'], 
-                              cwd=DATA_DIR, capture_output=True, text=True)
-        commit_hash = result.stdout.strip()[:7]
+        commit_hash = git_commit(filename, f'Update {filename}: {timestamp}')
         
-        return jsonify({
+        return ojsonify({
             "success": True,
             "message": "File saved and committed",
             "commit": commit_hash,
             "timestamp": timestamp
         })
     
-    except json.JSONDecodeError:
-        return jsonify({"error": "Invalid JSON format"}), 400
-    except yaml.YAMLError:
-        return jsonify({"error": "Invalid YAML format"}), 400
-    except ET.ParseError:
-        return jsonify({"error": "Invalid XML format"}), 400
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return ojsonify({"error": str(e)}, 500)
 
 @app.route('/api/history/<filename>', methods=['GET'])
 def get_history(filename):
     """Get file history from Git"""
+    if not _SAFE_NAME.fullmatch(filename):
+        return ojsonify({"error": "Invalid filename"}, 400)
+    
     try:
-        cmd = [
-            'git', 'log', 
-            '--pretty=format:{"hash":"%h","timestamp":"%ai","message":"%s"}',
-            '-n', '20', '--', filename
-        ]
-        result = subprocess.run(cmd, cwd=DATA_DIR, capture_output=True, text=True)
-        
-        history = []
-        for line in result.stdout.strip().split('\n'):
-            if line:
-                history.append(json.loads(line))
+        # History only changes when HEAD moves, commits made outside the app included.
+        # Read it before the log so a concurrent commit can only make the tag older.
+        etag = git_head()
+        if etag and request.if_none_match.contains_weak(etag):
+            return not_modified(etag)
         
-        return jsonify({"history": history})
+        response = ojsonify({"history": git_log(filename, 20)})
+        if etag:
+            response.set_etag(etag, weak=True)
+        return response
     
     except:
-        return jsonify({"history": []})
+        return ojsonify({"history": []})
 
 @app.route('/api/restore/<filename>/<hash>', methods=['POST'])
 def restore_version(filename, hash):
     """Restore file to specific version"""
+    if not _SAFE_NAME.fullmatch(filename):
+        return ojsonify({"error": "Invalid filename"}, 400)
+    
     try:
         # Get file content at specific commit
-        cmd = ['git', 'show', f'{hash}:{filename}']
-        result = subprocess.run(cmd, cwd=DATA_DIR, capture_output=True, text=True, check=True)
-        content = result.stdout
+        content = git_show(hash, filename)
         
         # Save as current version
         filepath = DATA_DIR / filename
-        filepath.write_text(content)
+        write_file(filepath, content)
         
         # Commit the restore
-        subprocess.run(['git', 'add', filename], cwd=DATA_DIR)
-        subprocess.run(['git', 'commit', '-m', f'Restored to version {hash}'], cwd=DATA_DIR)
+        git_commit(filename, f'Restored to version {hash}')
         
-        return jsonify({
+        return ojsonify({
             "success": True,
             "content": content,
             "message": f"Restored to version {hash}"
         })
     
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return ojsonify({"error": str(e)}, 500)
 
 @app.route('/api/files', methods=['GET'])
 def list_files():
     """List all editable files"""
     try:
-        valid_extensions = {'.json', '.yaml', '.yml', '.xml'}
-        files = [f.name for f in DATA_DIR.iterdir() 
-                if f.is_file() and f.suffix in valid_extensions]
-        return jsonify({"files": files})
+        files = list_data_files()
+        return ojsonify({"files": files})
     
     except:
-        return jsonify({"files": []})
-
-if __name__ == '__main__':
-    init_git()
-    print("""
-╔══════════════════════════════════════════╗
-║         Edit2 - Visual Data Editor        ║
-║            Python Flask Edition           ║
-║                                          ║
-║  Server running on http://localhost:3002 ║
-║                                          ║
-║  Usage:                                  ║
-║  edit2 file.json                        ║
-║  edit2 file.yaml                        ║
-║  edit2 file.xml                         ║
-╚══════════════════════════════════════════╝
-    """)
-    app.run(host='0.0.0.0', port=3002, debug=False)
+        return ojsonify({"files": []})
 
 # requirements.txt
 """
 Flask==2.3.3
 Flask-CORS==4.0.0
 PyYAML==6.0.1
+pygit2==1.13.3
+gunicorn==21.2.0
+orjson==3.9.10
+whitenoise==6.6.0
 """
 
 # Dockerfile
@@ -227,11 +632,31 @@ RUN mkdir -p /app/data
 # Expose port
 EXPOSE 3002
 
-# Start command
-CMD ["python", "app.py"]
+# Start command: one process (the Git repo and caches are per process),
+# many threads so requests waiting on disk or Git don't block each other
+CMD ["gunicorn", "--workers", "1", "--threads", "8", "--bind", "0.0.0.0:3002", "app:app"]
+"""
+
+# nginx.conf - Optional front proxy: static page from disk, only the API hits Python
+NGINX_CONF = """server {
+    listen 80;
+    sendfile on;
+
+    root /app/static;
+    index index.html;
+
+    location / {
+        try_files $uri $uri/ @flask;
+    }
+
+    location @flask {
+        proxy_pass http://127.0.0.1:3002;
+        proxy_set_header Host $host;
+    }
+}
 """
 
-# templates/index.html
+# templates/index.html (served from ./static by WhiteNoise, else inline by index())
 HTML_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -681,6 +1106,16 @@ HTML_TEMPLATE = """<!DOCTYPE html>
     </script>
 </body>
 </html>"""
+_INDEX_BYTES = HTML_TEMPLATE.encode('utf-8')
+
+# Serve the page from disk in front of Flask, so it never reaches a view
+STATIC_DIR = Path('./static')
+if WhiteNoise is not None:
+    STATIC_DIR.mkdir(exist_ok=True)
+    index_path = STATIC_DIR / 'index.html'
+    if not index_path.exists() or index_path.read_bytes() != _INDEX_BYTES:
+        index_path.write_bytes(_INDEX_BYTES)
+    app.wsgi_app = WhiteNoise(app.wsgi_app, root=str(STATIC_DIR), index_file=True, max_age=3600)
 
 # edit2.sh - Launch script
 LAUNCH_SCRIPT = """#!/bin/bash
@@ -721,4 +1156,20 @@ fi
 echo "Edit2 is running. Press Ctrl+C to stop."
 trap 'docker stop edit2 && docker rm edit2; exit' INT
 while true; do sleep 1; done
-"""
\ No newline at end of file
+"""
+
+if __name__ == '__main__':
+    print("""
+╔══════════════════════════════════════════╗
+║         Edit2 - Visual Data Editor        ║
+║            Python Flask Edition           ║
+║                                          ║
+║  Server running on http://localhost:3002 ║
+║                                          ║
+║  Usage:                                  ║
+║  edit2 file.json                        ║
+║  edit2 file.yaml                        ║
+║  edit2 file.xml                         ║
+╚══════════════════════════════════════════╝
+    """)
+    app.run(host='0.0.0.0', port=3002, debug=False)
\ No newline at end of file